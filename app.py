@@ -17,6 +17,10 @@ os.makedirs(UPLOAD_DIR, exist_ok=True)
 
 app = Flask(__name__, static_folder='.')
 
+# Serialize API responses compactly (no indentation / extra whitespace),
+# even when the app runs in debug mode. Requires Flask>=2.2.
+app.json.compact = True
+
 # ---------- Helpers ----------
 MONTHS = r'(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Sept|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)'
 DATE_RANGE_RE = re.compile(rf'({MONTHS}\s*\d{{4}}|\d{{4}})\s*[-–—]\s*(?:Present|{MONTHS}\s*\d{{4}}|\d{{4}})', re.I)
@@ -101,6 +105,25 @@ def extract_contact_fields(text):
         'title': title
     }
 
+def wants_flag(value):
+    """Return True if a query-string flag such as `debug=1` is switched on."""
+    return (value or '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+def parse_fields(fields):
+    """Split the raw comma-separated `fields=` query value into key names."""
+    return [f.strip() for f in (fields or '').split(',') if f.strip()]
+
+def select_fields(data, wanted):
+    """Keep only the requested top-level keys from a response dict.
+
+    Returns `(selected, unknown)` where `unknown` lists requested keys that
+    are not in `data`. An empty `wanted` returns the data unchanged.
+    """
+    if not wanted or not isinstance(data, dict):
+        return data, []
+    unknown = [k for k in wanted if k not in data]
+    return {k: data[k] for k in wanted if k in data}, unknown
+
 def split_blocks_by_blanklines(text):
     blocks = [b.strip() for b in re.split(r'\n{2,}', text) if b.strip()]
     return blocks
@@ -262,7 +285,7 @@ def reclassify_blocks(sections):
     return sections, moved
 
 # ---------- Main heuristics to JSON ----------
-def heuristics_to_json(text):
+def heuristics_to_json(text, debug=False):
     t = clean_extracted_text(text)
     contacts = extract_contact_fields(t)
     sections = split_sections(t)
@@ -287,11 +310,7 @@ def heuristics_to_json(text):
     languages = parse_languages(sections.get('languages',''))
     references = parse_references(sections.get('references',''))
 
-    debug = {k: (v[:400] + '...' if len(v) > 400 else v) for k,v in sections.items() if v}
-    debug['moved_blocks_count'] = len(moved_blocks)
-    debug['top_lines'] = '\n'.join([ln for ln in t.splitlines() if ln.strip()][:8])
-
-    return {
+    result = {
         'personal': {
             'name': contacts.get('name',''),
             'title': contacts.get('title',''),
@@ -305,10 +324,17 @@ def heuristics_to_json(text):
         'skills': skills,
         'soft_skills': soft_skills,
         'languages': languages,
-        'references': references,
-        '_debug_sections': debug
+        'references': references
     }
 
+    if debug:
+        debug_sections = {k: (v[:400] + '...' if len(v) > 400 else v) for k,v in sections.items() if v}
+        debug_sections['moved_blocks_count'] = len(moved_blocks)
+        debug_sections['top_lines'] = '\n'.join([ln for ln in t.splitlines() if ln.strip()][:8])
+        result['_debug_sections'] = debug_sections
+
+    return result
+
 # ---------- New endpoints for create functionality ----------
 @app.route('/api/save', methods=['POST'])
 def save_cv():
@@ -342,6 +368,9 @@ def load_cv():
         with open(filepath, 'r') as f:
             data = json.load(f)
             
+        data, unknown = select_fields(data, parse_fields(request.args.get('fields')))
+        if unknown:
+            return jsonify({'error': 'unknown fields', 'fields': unknown}), 400
         return jsonify(data)
     except Exception as e:
         return jsonify({'error': 'Failed to load CV', 'detail': str(e)}), 500
@@ -402,8 +431,13 @@ def parse_file():
             print("DOCX processing complete")
             
         print(f"Extracted text length: {len(text)} characters")
-        jsonv = heuristics_to_json(text)
+        fields = parse_fields(request.args.get('fields'))
+        debug = wants_flag(request.args.get('debug')) and (not fields or '_debug_sections' in fields)
+        jsonv = heuristics_to_json(text, debug=debug)
         print("Successfully parsed file")
+        jsonv, unknown = select_fields(jsonv, fields)
+        if unknown:
+            return jsonify({'error': 'unknown fields', 'fields': unknown}), 400
         return jsonify(jsonv)
         
     except Exception as e:
@@ -0,0 +1,70 @@
+"""Report /api/parse response sizes for the sample CV.
+
+Run from the repository root:
+
+    python benchmarks/payload_size.py [path/to/cv.txt]
+
+The CV text is uploaded as a DOCX through the Flask test client, so the
+numbers are the bytes the real endpoint sends. Each saving is reported on
+its own, measured against production (non-debug) output.
+"""
+import os, sys
+from contextlib import redirect_stdout
+from io import BytesIO, StringIO
+
+import docx
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from app import app
+
+SAMPLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sample_cv.txt')
+
+def make_docx(text):
+    doc = docx.Document()
+    for ln in text.splitlines():
+        doc.add_paragraph(ln)
+    buf = BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+def parse_size(content, query='', debug=False, compact=True):
+    app.debug = debug
+    app.json.compact = compact
+    try:
+        client = app.test_client()
+        # parse_file logs every upload; keep the report readable.
+        with redirect_stdout(StringIO()):
+            res = client.post('/api/parse' + query, data={'file': (BytesIO(content), 'cv.docx')})
+        assert res.status_code == 200, res.get_data(as_text=True)
+        return len(res.get_data())
+    finally:
+        app.debug = False
+        app.json.compact = True
+
+def pct(before, after):
+    return f'{(1 - after / before):.0%}'
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else SAMPLE
+    with open(path, encoding='utf-8') as f:
+        content = make_docx(f.read())
+
+    # Production (debug off): Flask was already compact, so the only saving
+    # is dropping _debug_sections by default.
+    with_debug = parse_size(content, '?debug=1')
+    default = parse_size(content)
+    selected = parse_size(content, '?fields=personal,skills')
+    print('production (debug off)')
+    print(f'  with _debug_sections:       {with_debug:6d} bytes')
+    print(f'  default (no debug):         {default:6d} bytes  (-{pct(with_debug, default)})')
+    print(f'  ?fields=personal,skills:    {selected:6d} bytes  (-{pct(with_debug, selected)})')
+
+    # Debug-mode servers: Flask used to indent; the compact setting removes it.
+    pretty = parse_size(content, debug=True, compact=None)
+    compact = parse_size(content, debug=True)
+    print('debug mode, same payload (no _debug_sections)')
+    print(f'  pretty-printed:             {pretty:6d} bytes')
+    print(f'  compact:                    {compact:6d} bytes  (-{pct(pretty, compact)})')
+
+if __name__ == '__main__':
+    main()
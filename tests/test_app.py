@@ -0,0 +1,97 @@
+import json
+import os
+import sys
+from io import BytesIO
+
+import docx
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import app as cv_app
+
+SAMPLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'benchmarks', 'sample_cv.txt')
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(cv_app, 'UPLOAD_DIR', str(tmp_path))
+    cv_app.app.config['TESTING'] = True
+    return cv_app.app.test_client()
+
+
+@pytest.fixture
+def cv_docx():
+    doc = docx.Document()
+    with open(SAMPLE, encoding='utf-8') as f:
+        for ln in f.read().splitlines():
+            doc.add_paragraph(ln)
+    buf = BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def post_cv(client, content, query=''):
+    return client.post('/api/parse' + query, data={'file': (BytesIO(content), 'cv.docx')})
+
+
+def test_parse_omits_debug_sections_by_default(client, cv_docx):
+    res = post_cv(client, cv_docx)
+    assert res.status_code == 200
+    data = res.get_json()
+    assert '_debug_sections' not in data
+    assert data['personal']['name'] == 'Jane Doe'
+
+
+def test_parse_includes_debug_sections_when_requested(client, cv_docx):
+    res = post_cv(client, cv_docx, '?debug=1')
+    assert res.status_code == 200
+    debug = res.get_json()['_debug_sections']
+    assert debug['top_lines'].startswith('Jane Doe')
+    assert 'moved_blocks_count' in debug
+
+
+def test_parse_skips_debug_sections_when_not_selected(client, cv_docx, monkeypatch):
+    calls = []
+    real = cv_app.heuristics_to_json
+
+    def spy(text, debug=False):
+        calls.append(debug)
+        return real(text, debug=debug)
+
+    monkeypatch.setattr(cv_app, 'heuristics_to_json', spy)
+    res = post_cv(client, cv_docx, '?debug=1&fields=personal')
+    assert res.status_code == 200
+    assert list(res.get_json()) == ['personal']
+    assert calls == [False]
+
+
+def test_parse_fields_filters_response(client, cv_docx):
+    res = post_cv(client, cv_docx, '?fields=personal,skills')
+    assert res.status_code == 200
+    assert sorted(res.get_json()) == ['personal', 'skills']
+
+
+def test_parse_unknown_fields_is_rejected(client, cv_docx):
+    res = post_cv(client, cv_docx, '?fields=personal,skils')
+    assert res.status_code == 400
+    assert res.get_json()['fields'] == ['skils']
+
+
+def test_load_fields_filters_response(client, tmp_path):
+    doc = {'personal': {'name': 'Jane'}, 'skills': ['Python'], 'education': []}
+    (tmp_path / 'cv_Jane.json').write_text(json.dumps(doc))
+
+    res = client.get('/api/load?filename=cv_Jane.json&fields=personal,skills')
+    assert res.status_code == 200
+    assert res.get_json() == {'personal': {'name': 'Jane'}, 'skills': ['Python']}
+
+    res = client.get('/api/load?filename=cv_Jane.json&fields=experience')
+    assert res.status_code == 400
+    assert res.get_json()['fields'] == ['experience']
+
+
+def test_responses_are_compact_in_debug_mode(client, cv_docx, monkeypatch):
+    monkeypatch.setattr(cv_app.app, 'debug', True)
+    body = post_cv(client, cv_docx).get_data(as_text=True)
+    assert '\n' not in body.strip()
+    assert '": ' not in body